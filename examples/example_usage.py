@@ -29,8 +29,8 @@ def circuit_template(params: List[float]) -> Circuit:
 
 def cost_function(circuit: Circuit) -> float:
     sim = Simulation(circuit=circuit)
-    results = sim.run(shots=100)
-    p1 = sum(count for key, count in results.items() if key[0] == 1) / 100.0
+    outcomes = sim.run(shots=100, return_array=True)
+    p1 = float((outcomes[:, 0] == 1).mean())
     return p1
 
 def main() -> None:
@@ -64,9 +64,9 @@ def main() -> None:
     print("Measurement Histogram:", results)
 
     init_params = [np.pi/4]
-    opt_params = variational_optimization(circuit_template, cost_function, init_params,
-                                          learning_rate=0.1, max_iter=50)
-    print("Optimized parameter:", opt_params)
+    opt_params, final_cost = variational_optimization(circuit_template, cost_function, init_params,
+                                                      learning_rate=0.1, max_iter=50)
+    print("Optimized parameter:", opt_params, "Final cost:", final_cost)
 
     opt_params_vqe, energy = vqe_stub(None, circuit_template, init_params,
                                       learning_rate=0.1, max_iter=50)
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from topoQ import _kernels
+from topoQ._jit import jit_loop
+
+
+def _random_unitary(dim, rng):
+    q, r = np.linalg.qr(rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim)))
+    return q * (np.diag(r) / np.abs(np.diag(r)))
+
+
+def _random_states(batch, num_qubits, rng):
+    states = rng.normal(size=(batch, 1 << num_qubits)) + 1j * rng.normal(size=(batch, 1 << num_qubits))
+    return states / np.linalg.norm(states, axis=1, keepdims=True)
+
+
+def _dense_reference(states, u, qubits, num_qubits):
+    """Embed u with np.kron and a permutation, then multiply every state."""
+    k = len(qubits)
+    rest = [q for q in range(num_qubits) if q not in qubits]
+    full = np.kron(u, np.eye(1 << (num_qubits - k)))
+    order = list(qubits) + rest
+    perm = np.empty(1 << num_qubits, dtype=int)
+    for index in range(1 << num_qubits):
+        bits = [(index >> (num_qubits - 1 - q)) & 1 for q in range(num_qubits)]
+        perm[index] = int("".join(str(bits[q]) for q in order), 2)
+    full = full[np.ix_(perm, perm)]
+    return states @ full.T
+
+
+def _numba_or_skip(factory):
+    kernel = jit_loop(factory, **_kernels._JIT_OPTIONS)
+    if kernel is None:
+        pytest.skip("numba is not installed")
+    return kernel
+
+
+@pytest.mark.parametrize("qubit", [0, 1, 2])
+def test_apply_1q_matches_kron(qubit):
+    rng = np.random.default_rng(qubit)
+    states = _random_states(3, 3, rng)
+    u = _random_unitary(2, rng)
+    expected = _dense_reference(states, u, [qubit], 3)
+
+    numpy_states = states.copy()
+    _kernels._apply_1q_numpy(numpy_states, u, 2 - qubit)
+    np.testing.assert_allclose(numpy_states, expected, atol=1e-12)
+
+    numba_states = states.copy()
+    _numba_or_skip(_kernels._make_apply_1q)(numba_states, u, 2 - qubit)
+    np.testing.assert_allclose(numba_states, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("q1,q2", [(0, 1), (1, 0), (0, 2), (2, 1)])
+def test_apply_2q_matches_kron(q1, q2):
+    rng = np.random.default_rng(10 * q1 + q2)
+    states = _random_states(3, 3, rng)
+    u = _random_unitary(4, rng)
+    expected = _dense_reference(states, u, [q1, q2], 3)
+
+    numpy_states = states.copy()
+    _kernels._apply_2q_numpy(numpy_states, u, 2 - q1, 2 - q2)
+    np.testing.assert_allclose(numpy_states, expected, atol=1e-12)
+
+    numba_states = states.copy()
+    _numba_or_skip(_kernels._make_apply_2q)(numba_states, u, 2 - q1, 2 - q2)
+    np.testing.assert_allclose(numba_states, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("qubits", [[0, 1, 2], [2, 0, 3], [1]])
+def test_apply_dense_matches_kron(qubits):
+    rng = np.random.default_rng(len(qubits))
+    states = _random_states(2, 4, rng)
+    u = _random_unitary(1 << len(qubits), rng)
+    expected = _dense_reference(states, u, qubits, 4)
+    _kernels.apply_dense(states, u, qubits, 4)
+    np.testing.assert_allclose(states, expected, atol=1e-12)
+
+
+def test_apply_dense_rejects_wrong_size():
+    states = np.zeros((1, 8), dtype=np.complex128)
+    with pytest.raises(ValueError):
+        _kernels.apply_dense(states, np.eye(4), [0, 1, 2], 3)
@@ -0,0 +1,16 @@
+import pytest
+
+from topoQ import compute_error_metrics
+
+
+def test_scalar_outcomes():
+    err_a, err_b = compute_error_metrics([0, 1, 1, 1], {1: 1.0})
+    assert err_a == pytest.approx(0.5)
+    assert err_b == 0.0
+
+
+def test_tuple_outcomes_are_counted_whole():
+    err_a, _ = compute_error_metrics([(0, 1), (1, 1)], {(0, 1): 1.0})
+    assert err_a == pytest.approx(1.0)
+    err_a, _ = compute_error_metrics([(0, None), (0, None)], {(0, None): 1.0})
+    assert err_a == pytest.approx(0.0)
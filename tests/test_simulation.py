@@ -0,0 +1,72 @@
+import numpy as np
+
+from topoQ import Circuit, CliffordGate, CZGate, GenericGate, Simulation, Tetron
+
+_X = np.array([[0, 1], [1, 0]], dtype=complex)
+
+
+def _circuit(num_qubits):
+    circuit = Circuit()
+    for _ in range(num_qubits):
+        circuit.add_qubit(Tetron())
+    return circuit
+
+
+def _bell_circuit():
+    # H on both, CZ, H on the target: a CNOT-prepared Bell state.
+    circuit = _circuit(2)
+    circuit.apply_gate(CliffordGate("H"), 0)
+    circuit.apply_gate(CliffordGate("H"), 1)
+    circuit.apply_multi_qubit_gate(CZGate(), [0, 1])
+    circuit.apply_gate(CliffordGate("H"), 1)
+    return circuit
+
+
+def test_bell_state_histogram():
+    np.random.seed(0)
+    circuit = _bell_circuit()
+    circuit.measure(0)
+    circuit.measure(1)
+    counts = Simulation(circuit).run(shots=2000)
+    assert set(counts) == {(0, 0), (1, 1)}
+    assert abs(counts[(0, 0)] - 1000) < 150
+
+
+def test_mid_circuit_measurement_keeps_correlation():
+    np.random.seed(1)
+    circuit = _bell_circuit()
+    circuit.measure(0)
+    circuit.apply_gate(GenericGate(_X), 1)
+    circuit.measure(1)
+    counts = Simulation(circuit).run(shots=2000)
+    assert set(counts) == {(0, 1), (1, 0)}
+
+
+def test_reset_after_entangling():
+    np.random.seed(2)
+    circuit = _bell_circuit()
+    circuit.reset(1)
+    circuit.measure(0)
+    circuit.measure(1)
+    counts = Simulation(circuit).run(shots=2000)
+    assert set(counts) == {(0, 0), (1, 0)}
+
+    circuit = _bell_circuit()
+    circuit.reset()
+    circuit.measure(0)
+    circuit.measure(1)
+    assert Simulation(circuit).run(shots=500) == {(0, 0): 500}
+
+
+def test_three_qubit_gate_uses_dense_path():
+    # X on qubit 2 controlled on qubits 0 and 1 (Toffoli).
+    toffoli = np.eye(8, dtype=complex)
+    toffoli[6:, 6:] = _X
+    circuit = _circuit(3)
+    circuit.apply_gate(GenericGate(_X), 0)
+    circuit.apply_gate(GenericGate(_X), 1)
+    circuit.apply_multi_qubit_gate(GenericGate(toffoli), [0, 1, 2])
+    for qubit in range(3):
+        circuit.measure(qubit)
+    assert Simulation(circuit).run(shots=100) == {(1, 1, 1): 100}
+
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from topoQ import Stabilizer
+
+
+@pytest.mark.parametrize("qubit_indices,paulis", [
+    ([0], ["X"]),
+    ([1], ["Y"]),
+    ([2], ["Z"]),
+    ([0, 2], ["X", "Z"]),
+    ([3, 1], ["Y", "X"]),
+    ([0, 2, 3], ["Y", "Y", "Z"]),
+    ([1, 3], ["Z", "Y"]),
+])
+def test_measure_matches_dense_operator(qubit_indices, paulis):
+    stabilizer = Stabilizer(qubit_indices, paulis)
+    rng = np.random.default_rng(len(paulis))
+    dim = 1 << (max(qubit_indices) + 1)
+    state = rng.normal(size=dim) + 1j * rng.normal(size=dim)
+    state /= np.linalg.norm(state)
+    expected = np.vdot(state, stabilizer.build_operator() @ state)
+    assert np.isclose(stabilizer.measure(state), expected)
@@ -0,0 +1,17 @@
+from topoQ import Circuit, OpKind, Tetron, circuit_from_json, circuit_to_json
+
+
+def test_reset_all_round_trip():
+    circuit = Circuit()
+    for _ in range(2):
+        circuit.add_qubit(Tetron())
+    circuit.measure(0)
+    circuit.reset()
+    circuit.reset(1)
+    restored = circuit_from_json(circuit_to_json(circuit))
+    assert len(restored.qubits) == 2
+    assert restored.operations == [
+        (OpKind.MEASURE, 0, "Z"),
+        (OpKind.RESET_ALL,),
+        (OpKind.RESET, 1),
+    ]
@@ -0,0 +1,173 @@
+import numpy as np
+import pytest
+
+from topoQ import (BraidingGate, Circuit, CliffordGate, OpKind, Tetron, qaoa_stub,
+                   variational_optimization, variational_optimization_jit,
+                   variational_optimization_multistart, vqe_stub)
+
+
+def _one_gate_template(params):
+    circuit = Circuit()
+    circuit.add_qubit(Tetron())
+    circuit.apply_gate(BraidingGate(params[0], "X"), 0)
+    return circuit
+
+
+def _two_gate_template(params):
+    circuit = Circuit()
+    circuit.add_qubit(Tetron())
+    circuit.apply_gate(BraidingGate(params[0], "X"), 0)
+    circuit.apply_gate(CliffordGate("H"), 0)
+    circuit.apply_gate(BraidingGate(params[1], "Y"), 0)
+    return circuit
+
+
+def _exact_cost(circuit):
+    """Probability of measuring |1> after the circuit's gates, computed exactly."""
+    state = np.array([1, 0], dtype=complex)
+    for op in circuit.operations:
+        if op[0] == OpKind.GATE:
+            state = op[2].matrix() @ state
+    return float(abs(state[1]) ** 2)
+
+
+def _gradient(template, params, **kwargs):
+    """Gradient used by one plain SGD step with unit learning rate."""
+    start = np.array(params, dtype=float)
+    end = variational_optimization(template, _exact_cost, start, learning_rate=1.0,
+                                   max_iter=1, tol=0, progress=False,
+                                   return_cost=False, **kwargs)
+    return start - end
+
+
+@pytest.mark.parametrize("gradient_method,atol", [("parameter_shift", 1e-12),
+                                                  ("finite_diff", 1e-4)])
+def test_gradient_matches_analytic_derivative(gradient_method, atol):
+    # exp(-iθX)|0> = cos θ|0> - i sin θ|1>, so the cost is sin²θ.
+    theta = 0.37
+    grad = _gradient(_one_gate_template, [theta], gradient_method=gradient_method)
+    np.testing.assert_allclose(grad, [np.sin(2 * theta)], atol=atol)
+
+
+def _bind(template, params):
+    return _two_gate_template(params)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"n_jobs": 2},
+    {"batch_cost_function": lambda circuits: [_exact_cost(c) for c in circuits]},
+    {"bind_fn": _bind},
+    {"parameter_indices": [0, 2]},
+    {"params_as_array": True},
+])
+def test_evaluation_paths_agree(kwargs):
+    params = [0.3, 0.2]
+    expected = _gradient(_two_gate_template, params)
+    np.testing.assert_allclose(_gradient(_two_gate_template, params, **kwargs), expected,
+                               atol=1e-12)
+
+
+def test_tol_stops_at_a_stationary_point():
+    calls = []
+
+    def cost(circuit):
+        calls.append(circuit)
+        return _exact_cost(circuit)
+
+    params, _ = variational_optimization(_one_gate_template, cost, [0.0], max_iter=50,
+                                         progress=False)
+    # One gradient (two shifted evaluations), then the final cost.
+    assert len(calls) == 3
+    assert params[0] == 0.0
+
+
+def test_copy_flag_controls_in_place_update():
+    start = np.array([0.3, 0.7])
+    params = variational_optimization(_two_gate_template, _exact_cost, start, max_iter=3,
+                                      progress=False, return_cost=False)
+    np.testing.assert_array_equal(start, [0.3, 0.7])
+    assert params is not start
+
+    params = variational_optimization(_two_gate_template, _exact_cost, start, max_iter=3,
+                                      progress=False, return_cost=False, copy=False)
+    assert params is start
+    assert not np.array_equal(start, [0.3, 0.7])
+
+
+def test_return_cost():
+    params, cost = variational_optimization(_two_gate_template, _exact_cost, [0.3, 0.7],
+                                            max_iter=3, progress=False)
+    assert cost == pytest.approx(_exact_cost(_two_gate_template(params)))
+    params_only = variational_optimization(_two_gate_template, _exact_cost, [0.3, 0.7],
+                                           max_iter=3, progress=False, return_cost=False)
+    assert isinstance(params_only, np.ndarray)
+    np.testing.assert_allclose(params_only, params)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"parameter_indices": [0, 2], "n_jobs": 2},
+    {"parameter_indices": [0, 2], "batch_cost_function": len},
+    {"batch_cost_function": len, "n_jobs": 2},
+    {"parameter_indices": [0]},
+    {"gradient_method": "adjoint"},
+    {"optimizer": "lbfgs"},
+])
+def test_invalid_options_raise(kwargs):
+    with pytest.raises(ValueError):
+        variational_optimization(_two_gate_template, _exact_cost, [0.3, 0.7],
+                                 progress=False, **kwargs)
+
+
+def test_adam_and_metric_tensor_converge():
+    for kwargs in ({"optimizer": "adam", "learning_rate": 0.05},
+                   {"metric_tensor_fn": lambda params: np.eye(len(params))}):
+        _, cost = variational_optimization(_two_gate_template, _exact_cost, [0.3, 0.7],
+                                           max_iter=300, progress=False, **kwargs)
+        assert cost < 1e-3
+
+
+def test_jit_optimizer():
+    try:
+        from numba import njit
+    except ImportError:
+        def njit(fn):
+            return fn
+
+    @njit
+    def cost(params):
+        return ((params - 1.0) ** 2).sum()
+
+    start = np.array([0.0, 2.0])
+    params, final = variational_optimization_jit(cost, start, max_iter=200)
+    np.testing.assert_allclose(params, [1.0, 1.0], atol=1e-4)
+    assert final == pytest.approx(cost(params))
+    np.testing.assert_array_equal(start, [0.0, 2.0])
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_multistart_returns_best_run(n_jobs):
+    starts = [np.array([1.2, -0.4]), np.array([0.3, 0.2])]
+    params, cost = variational_optimization_multistart(
+        _two_gate_template, _exact_cost, starts, n_jobs=n_jobs, max_iter=30,
+        learning_rate=0.3,
+    )
+    runs = [variational_optimization(_two_gate_template, _exact_cost, p, max_iter=30,
+                                     learning_rate=0.3, progress=False) for p in starts]
+    assert cost == pytest.approx(min(run[1] for run in runs))
+    np.testing.assert_array_equal(starts[0], [1.2, -0.4])
+
+
+def test_multistart_rejects_empty_start_list():
+    with pytest.raises(ValueError):
+        variational_optimization_multistart(_two_gate_template, _exact_cost, [])
+
+
+def test_stub_return_shapes():
+    params, energy = vqe_stub(None, _two_gate_template, [0.3, 0.7], max_iter=2,
+                              progress=False, return_cost=False)
+    assert params.shape == (2,)
+    assert isinstance(energy, float)
+    params, solution = qaoa_stub(None, _two_gate_template, [0.3, 0.7], max_iter=2,
+                                 progress=False)
+    assert params.shape == (2,)
+    assert isinstance(solution, str)
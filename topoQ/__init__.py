@@ -16,7 +16,7 @@ This package supports:
 
 from .qubit import Tetron
 from .gates import BraidingGate, CliffordGate, TGate, GenericGate, CZGate
-from .circuit import Circuit, SubCircuit
+from .circuit import Circuit, SubCircuit, OpKind
 from .stabilizer import Stabilizer, StabilizerCode
 from .measurement import perform_measurement, compute_error_metrics
 from .error_model import DepolarizingNoise, AssignmentError, AmplitudeDampingNoise
@@ -24,7 +24,8 @@ from .simulation import Simulation, run_density_matrix_simulation
 from .visualization import draw_circuit, draw_bloch_sphere, interactive_circuit_view
 from .transpiler import circuit_to_json, circuit_from_json, circuit_to_openqasm
 from .optimizer import optimize_circuit
-from .var_algo import variational_optimization, vqe_stub, qaoa_stub
+from .var_algo import (variational_optimization, variational_optimization_jit,
+                       variational_optimization_multistart, vqe_stub, qaoa_stub)
 
 # Plugin registry for extensibility.
 _plugins = {}
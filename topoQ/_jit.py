@@ -0,0 +1,21 @@
+"""
+Lazy Numba compilation shared by topoQ's numeric loops.
+Numba is imported on first use, so importing topoQ does not pay for it.
+"""
+
+from functools import lru_cache
+from typing import Callable, Optional
+
+
+@lru_cache(maxsize=None)
+def jit_loop(factory: Callable[[Callable], Callable], **options) -> Optional[Callable]:
+    """
+    Compile factory(numba.prange) with numba.njit(parallel=True, **options),
+    once per factory, or return None if Numba is not installed. factory
+    receives the range function its loop should iterate with.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(parallel=True, **options)(factory(numba.prange))
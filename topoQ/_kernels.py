@@ -0,0 +1,118 @@
+"""
+Statevector kernels for topoQ.
+
+States are stored as a C-contiguous (batch, 2**n) complex128 array, where
+qubit 0 is the most significant bit of the basis index (the same ordering as
+np.kron). Gates are applied in place. Numba-compiled kernels are used when
+Numba is installed; otherwise an equivalent NumPy implementation is used.
+Numba is imported on the first kernel call, not when topoQ is imported.
+"""
+
+from typing import Callable, Sequence
+
+import numpy as np
+
+from ._jit import jit_loop
+
+_JIT_OPTIONS = dict(cache=True, fastmath=True)
+
+
+def _make_apply_1q(prange: Callable) -> Callable:
+    def apply_1q_loop(states, u, t):
+        stride = 1 << t
+        half = states.shape[1] >> 1
+        u00, u01, u10, u11 = u[0, 0], u[0, 1], u[1, 0], u[1, 1]
+        for idx in prange(states.shape[0] * half):
+            s = idx // half
+            g = idx % half
+            k0 = ((g >> t) << (t + 1)) | (g & (stride - 1))
+            k1 = k0 | stride
+            a = states[s, k0]
+            b = states[s, k1]
+            states[s, k0] = u00 * a + u01 * b
+            states[s, k1] = u10 * a + u11 * b
+    return apply_1q_loop
+
+
+def _make_apply_2q(prange: Callable) -> Callable:
+    def apply_2q_loop(states, u, t1, t2):
+        lo = min(t1, t2)
+        hi = max(t1, t2)
+        m1 = 1 << t1
+        m2 = 1 << t2
+        quarter = states.shape[1] >> 2
+        for idx in prange(states.shape[0] * quarter):
+            s = idx // quarter
+            g = idx % quarter
+            k = ((g >> lo) << (lo + 1)) | (g & ((1 << lo) - 1))
+            k00 = ((k >> hi) << (hi + 1)) | (k & ((1 << hi) - 1))
+            k01 = k00 | m2
+            k10 = k00 | m1
+            k11 = k10 | m2
+            a0 = states[s, k00]
+            a1 = states[s, k01]
+            a2 = states[s, k10]
+            a3 = states[s, k11]
+            states[s, k00] = u[0, 0] * a0 + u[0, 1] * a1 + u[0, 2] * a2 + u[0, 3] * a3
+            states[s, k01] = u[1, 0] * a0 + u[1, 1] * a1 + u[1, 2] * a2 + u[1, 3] * a3
+            states[s, k10] = u[2, 0] * a0 + u[2, 1] * a1 + u[2, 2] * a2 + u[2, 3] * a3
+            states[s, k11] = u[3, 0] * a0 + u[3, 1] * a1 + u[3, 2] * a2 + u[3, 3] * a3
+    return apply_2q_loop
+
+
+def _apply_1q_numpy(states: np.ndarray, u: np.ndarray, t: int) -> None:
+    low = 1 << t
+    view = states.reshape(states.shape[0], -1, 2, low)
+    view[...] = np.einsum("ij,bhjl->bhil", u, view)
+
+
+def _apply_2q_numpy(states: np.ndarray, u: np.ndarray, t1: int, t2: int) -> None:
+    lo, hi = min(t1, t2), max(t1, t2)
+    view = states.reshape(states.shape[0], -1, 2, 1 << (hi - lo - 1), 2, 1 << lo)
+    u4 = u.reshape(2, 2, 2, 2)
+    if t1 < t2:
+        # The first gate qubit sits on the lower bit; swap the tensor legs.
+        u4 = u4.transpose(1, 0, 3, 2)
+    view[...] = np.einsum("pqrs,zarbsc->zapbqc", u4, view)
+
+
+def apply_1q(states: np.ndarray, u: np.ndarray, qubit: int, num_qubits: int) -> None:
+    """Apply the 2x2 unitary u to `qubit` of every state in the batch, in place."""
+    u = np.ascontiguousarray(u, dtype=np.complex128)
+    t = num_qubits - 1 - qubit
+    kernel = jit_loop(_make_apply_1q, **_JIT_OPTIONS)
+    if kernel is not None:
+        kernel(states, u, t)
+    else:
+        _apply_1q_numpy(states, u, t)
+
+
+def apply_2q(states: np.ndarray, u: np.ndarray, q1: int, q2: int, num_qubits: int) -> None:
+    """
+    Apply the 4x4 unitary u to qubits (q1, q2) of every state in the batch,
+    in place. u is expressed in the |q1 q2> basis, as np.kron(A, B) would be.
+    """
+    u = np.ascontiguousarray(u, dtype=np.complex128)
+    t1 = num_qubits - 1 - q1
+    t2 = num_qubits - 1 - q2
+    kernel = jit_loop(_make_apply_2q, **_JIT_OPTIONS)
+    if kernel is not None:
+        kernel(states, u, t1, t2)
+    else:
+        _apply_2q_numpy(states, u, t1, t2)
+
+
+def apply_dense(states: np.ndarray, u: np.ndarray, qubits: Sequence[int], num_qubits: int) -> None:
+    """
+    Apply the 2^k x 2^k unitary u to `qubits` of every state in the batch,
+    in place, by a dense tensor contraction. Used for gates on three or more
+    qubits, which have no dedicated kernel.
+    """
+    k = len(qubits)
+    if u.shape != (1 << k, 1 << k):
+        raise ValueError(f"A gate on {k} qubits needs a {1 << k}x{1 << k} matrix.")
+    tensor = states.reshape((states.shape[0],) + (2,) * num_qubits)
+    axes = [q + 1 for q in qubits]
+    moved = np.moveaxis(tensor, axes, range(1, k + 1)).reshape(states.shape[0], 1 << k, -1)
+    moved = np.einsum("ij,bjr->bir", u, moved).reshape((states.shape[0],) + (2,) * num_qubits)
+    tensor[...] = np.moveaxis(moved, range(1, k + 1), axes)
@@ -2,43 +2,60 @@
 Defines the Circuit and SubCircuit classes.
 """
 
+from enum import IntEnum
 from typing import List, Tuple, Union, Any
 from .qubit import Tetron
 
 
+class OpKind(IntEnum):
+    """
+    Tag stored in position 0 of every operation tuple. Consumers dispatch by
+    indexing handler tuples with it instead of comparing strings.
+    """
+    GATE = 0
+    MULTI_GATE = 1
+    MEASURE = 2
+    RESET = 3
+    RESET_ALL = 4
+
+
+# Serialized name of each OpKind, indexed by its value.
+OP_NAMES: Tuple[str, ...] = ("gate", "multi_gate", "measure", "reset", "reset_all")
+
+
 class Circuit:
     """
     Represents a quantum circuit.
-    Each operation is a tuple:
-      ("gate", qubit_index: int, op: Any),
-      ("multi_gate", qubit_indices: List[int], op: Any),
-      ("measure", qubit_index: int, basis: str), or
-      ("reset", qubit_index: int).
+    Each operation is a tuple tagged with an OpKind:
+      (OpKind.GATE, qubit_index: int, op: Any),
+      (OpKind.MULTI_GATE, qubit_indices: List[int], op: Any),
+      (OpKind.MEASURE, qubit_index: int, basis: str),
+      (OpKind.RESET, qubit_index: int), or
+      (OpKind.RESET_ALL,) to reset every qubit at once.
     """
 
     def __init__(self) -> None:
         self.qubits: List[Tetron] = []
-        self.operations: List[Tuple[str, Any, Any]] = []
+        self.operations: List[Tuple[OpKind, Any, Any]] = []
         self.subcircuits: List[SubCircuit] = []
 
     def add_qubit(self, qubit: Tetron) -> None:
         self.qubits.append(qubit)
 
     def apply_gate(self, gate: Any, qubit_index: int) -> None:
-        self.operations.append(("gate", qubit_index, gate))
+        self.operations.append((OpKind.GATE, qubit_index, gate))
 
     def apply_multi_qubit_gate(self, gate: Any, qubit_indices: List[int]) -> None:
-        self.operations.append(("multi_gate", qubit_indices, gate))
+        self.operations.append((OpKind.MULTI_GATE, qubit_indices, gate))
 
     def measure(self, qubit_index: int, basis: str = "Z") -> None:
-        self.operations.append(("measure", qubit_index, basis))
+        self.operations.append((OpKind.MEASURE, qubit_index, basis))
 
     def reset(self, qubit_index: Union[int, None] = None) -> None:
         if qubit_index is None:
-            for i in range(len(self.qubits)):
-                self.operations.append(("reset", i))
+            self.operations.append((OpKind.RESET_ALL,))
         else:
-            self.operations.append(("reset", qubit_index))
+            self.operations.append((OpKind.RESET, qubit_index))
 
     def add_subcircuit(self, subcircuit: "SubCircuit") -> None:
         self.subcircuits.append(subcircuit)
@@ -46,17 +63,7 @@ class Circuit:
     def run(self) -> dict:
         results: dict = {}
         for op in self.operations:
-            if op[0] == "gate":
-                self.qubits[op[1]].apply_single_qubit_gate(op[2].matrix())
-            elif op[0] == "multi_gate":
-                # Stub for multi-qubit gate simulation.
-                indices = op[1]
-                results[f"multi_{indices}"] = "Applied multi-qubit gate (stub)"
-            elif op[0] == "measure":
-                outcome = self.qubits[op[1]].measure(op[2])
-                results[op[1]] = outcome
-            elif op[0] == "reset":
-                self.qubits[op[1]].reset()
+            _RUN_HANDLERS[op[0]](self, op, results)
         return results
 
     def clear_operations(self) -> None:
@@ -66,6 +73,32 @@ class Circuit:
         return f"Circuit({len(self.qubits)} qubits, {len(self.operations)} operations)"
 
 
+def _run_gate(circuit: Circuit, op: tuple, results: dict) -> None:
+    circuit.qubits[op[1]].apply_single_qubit_gate(op[2].matrix())
+
+
+def _run_multi_gate(circuit: Circuit, op: tuple, results: dict) -> None:
+    # Stub for multi-qubit gate simulation.
+    results[f"multi_{op[1]}"] = "Applied multi-qubit gate (stub)"
+
+
+def _run_measure(circuit: Circuit, op: tuple, results: dict) -> None:
+    results[op[1]] = circuit.qubits[op[1]].measure(op[2])
+
+
+def _run_reset(circuit: Circuit, op: tuple, results: dict) -> None:
+    circuit.qubits[op[1]].reset()
+
+
+def _run_reset_all(circuit: Circuit, op: tuple, results: dict) -> None:
+    for qubit in circuit.qubits:
+        qubit.reset()
+
+
+# Indexed by OpKind.
+_RUN_HANDLERS = (_run_gate, _run_multi_gate, _run_measure, _run_reset, _run_reset_all)
+
+
 class SubCircuit(Circuit):
     """
     Represents a subcircuit (a modular component of a larger circuit).
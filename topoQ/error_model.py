@@ -2,6 +2,7 @@
 Error models for topoQ.
 """
 
+import math
 import numpy as np
 from typing import Any
 from .utils import pauli_operator
@@ -30,17 +31,21 @@ class AmplitudeDampingNoise:
 
     def __init__(self, gamma: float) -> None:
         self.gamma: float = gamma
+        self._E0: np.ndarray = np.array([[1, 0], [0, math.sqrt(1 - gamma)]], dtype=complex)
+        self._E1: np.ndarray = np.array([[0, math.sqrt(gamma)], [0, 0]], dtype=complex)
 
     def apply(self, state: np.ndarray) -> np.ndarray:
-        E0 = np.array([[1, 0], [0, np.sqrt(1 - self.gamma)]], dtype=complex)
-        E1 = np.array([[0, np.sqrt(self.gamma)], [0, 0]], dtype=complex)
-        p0 = np.vdot(state, E0.conj().T @ E0 @ state).real
-        p1 = np.vdot(state, E1.conj().T @ E1 @ state).real
+        # E0†E0 = diag(1, 1-γ) and E1†E1 = diag(0, γ), so both branch
+        # probabilities follow directly from the amplitude magnitudes.
+        a2 = state[0].real ** 2 + state[0].imag ** 2
+        b2 = state[1].real ** 2 + state[1].imag ** 2
+        p1 = self.gamma * b2
+        p0 = a2 + b2 - p1
         r = np.random.rand()
         if r < p0 and p0 > 0:
-            return np.dot(E0, state) / np.sqrt(p0)
+            return np.dot(self._E0, state) / math.sqrt(p0)
         elif p1 > 0:
-            return np.dot(E1, state) / np.sqrt(p1)
+            return np.dot(self._E1, state) / math.sqrt(p1)
         return state
 
 
@@ -2,25 +2,48 @@
 Defines gate classes for topoQ.
 """
 
+import cmath
+import math
 import numpy as np
 from typing import Any
 from .utils import pauli_operator
 
+# Fixed gate matrices, shared read-only by every gate instance.
+_H = (1 / math.sqrt(2)) * np.array([[1, 1], [1, -1]], dtype=complex)
+_S = np.array([[1, 0], [0, 1j]], dtype=complex)
+_T = np.array([[1, 0], [0, cmath.exp(1j * math.pi / 4)]], dtype=complex)
+for _matrix in (_H, _S, _T):
+    _matrix.setflags(write=False)
+_CLIFFORD_MATRICES = {"H": _H, "S": _S}
+
 
 class BraidingGate:
     """
     Implements a braiding gate: U(θ) = exp(-i θ G),
     where G is a Pauli operator (e.g., "X" or "Z").
+    Since G² = I, the exponential has the closed form cos(θ) I - i sin(θ) G,
+    which is computed once whenever θ is set. Expectation values are then
+    sinusoids in 2θ, so the parameter-shift rule uses a shift of π/4.
     """
 
     def __init__(self, theta: float, generator: str = "X") -> None:
-        self.theta: float = theta
         self.generator_name: str = generator.upper()
         self.generator: np.ndarray = pauli_operator(self.generator_name)
+        self.theta = theta
+
+    @property
+    def theta(self) -> float:
+        return self._theta
+
+    @theta.setter
+    def theta(self, value: float) -> None:
+        self._theta: float = value
+        self._matrix: np.ndarray = -1j * math.sin(value) * self.generator
+        self._matrix[0, 0] += math.cos(value)
+        self._matrix[1, 1] += math.cos(value)
 
     def matrix(self) -> np.ndarray:
-        from scipy.linalg import expm
-        return expm(-1j * self.theta * self.generator)
+        return self._matrix
 
     def __str__(self) -> str:
         return f"BraidingGate(theta={self.theta}, generator={self.generator_name})"
@@ -36,12 +59,10 @@ class CliffordGate:
         self._matrix: np.ndarray = self.get_matrix(self.name)
 
     def get_matrix(self, name: str) -> np.ndarray:
-        if name == "H":
-            return (1 / np.sqrt(2)) * np.array([[1, 1], [1, -1]], dtype=complex)
-        elif name == "S":
-            return np.array([[1, 0], [0, 1j]], dtype=complex)
-        else:
-            raise ValueError("Unsupported Clifford gate. Use 'H' or 'S'.")
+        try:
+            return _CLIFFORD_MATRICES[name]
+        except KeyError:
+            raise ValueError("Unsupported Clifford gate. Use 'H' or 'S'.") from None
 
     def matrix(self) -> np.ndarray:
         return self._matrix
@@ -56,7 +77,7 @@ class TGate:
     """
 
     def __init__(self) -> None:
-        self._matrix: np.ndarray = np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex)
+        self._matrix: np.ndarray = _T
 
     def matrix(self) -> np.ndarray:
         return self._matrix
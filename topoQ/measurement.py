@@ -2,6 +2,8 @@
 Measurement routines for topoQ.
 """
 
+import numpy as np
+from collections import Counter
 from typing import Dict, List, Tuple
 
 
@@ -20,10 +22,16 @@ def compute_error_metrics(
     Compute total variation distance between measured histogram and ideal distribution.
     Returns a tuple (assignment error, bias error).
     """
-    measured = {x: measurements.count(x) / len(measurements) for x in set(measurements)}
+    if len(measurements) and np.isscalar(measurements[0]):
+        arr = np.asarray(measurements)
+        vals, counts = np.unique(arr, return_counts=True)
+        measured = dict(zip(vals.tolist(), (counts / arr.size).tolist()))
+    else:
+        # Tuple outcomes (Simulation histogram keys) must not be flattened.
+        measured = {x: n / len(measurements) for x, n in Counter(measurements).items()}
     err_a = sum(
         abs(measured.get(x, 0) - ideal_distribution.get(x, 0))
-        for x in set(list(measured.keys()) + list(ideal_distribution.keys()))
+        for x in measured.keys() | ideal_distribution.keys()
     )
     err_b = 0.0  # Stub for bias error calculation.
     return err_a, err_b
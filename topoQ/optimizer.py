@@ -5,6 +5,7 @@ Merges consecutive single-qubit gates using a simple heuristic.
 
 import numpy as np
 from typing import Any
+from .circuit import OpKind
 from .gates import GenericGate
 
 
@@ -18,19 +19,33 @@ def optimize_circuit(circuit: Any) -> Any:
     ops = circuit.operations
     i = 0
     while i < len(ops):
-        if ops[i][0] == "gate":
+        if ops[i][0] == OpKind.GATE:
             qubit_idx = ops[i][1]
-            merged_matrix = ops[i][2].matrix()
             j = i + 1
-            while j < len(ops) and ops[j][0] == "gate" and ops[j][1] == qubit_idx:
-                merged_matrix = ops[j][2].matrix() @ merged_matrix
+            while j < len(ops) and ops[j][0] == OpKind.GATE and ops[j][1] == qubit_idx:
                 j += 1
-            if not np.allclose(merged_matrix, np.eye(2)):
-                new_gate = GenericGate(merged_matrix)
-                new_ops.append(("gate", qubit_idx, new_gate))
+            mats = [ops[k][2].matrix() for k in range(i, j)]
+            merged_matrix = mats[-1]
+            for k in range(len(mats) - 2, -1, -1):
+                merged_matrix = merged_matrix @ mats[k]
+            if not _is_identity(merged_matrix):
+                if j - i == 1:
+                    new_ops.append(ops[i])
+                else:
+                    new_ops.append((OpKind.GATE, qubit_idx, GenericGate(merged_matrix)))
             i = j
         else:
             new_ops.append(ops[i])
             i += 1
     circuit.operations = new_ops
     return circuit
+
+
+def _is_identity(m: np.ndarray, tol: float = 1e-12) -> bool:
+    """Scalar check that a 2x2 matrix is the identity, without temporaries."""
+    return (
+        abs(m[0, 0] - 1) < tol
+        and abs(m[1, 1] - 1) < tol
+        and abs(m[0, 1]) < tol
+        and abs(m[1, 0]) < tol
+    )
@@ -6,6 +6,13 @@ import numpy as np
 from typing import Optional
 from .utils import pauli_operator
 
+_KET0 = np.array([1, 0], dtype=complex)
+_KET1 = np.array([0, 1], dtype=complex)
+_KETPLUS = np.array([1, 1], dtype=complex) / np.sqrt(2)
+_KETMINUS = np.array([1, -1], dtype=complex) / np.sqrt(2)
+for _ket in (_KET0, _KET1, _KETPLUS, _KETMINUS):
+    _ket.setflags(write=False)
+
 
 class Tetron:
     """
@@ -18,25 +25,26 @@ class Tetron:
       X = i * γ1 * γ3 = -i * γ2 * γ4.
       
     |0> is the +1 eigenstate of Z; |1> is the -1 eigenstate.
+
+    Operations are recorded in `history` only when track_history=True.
     """
 
-    def __init__(self, use_density_matrix: bool = False) -> None:
+    def __init__(self, use_density_matrix: bool = False, track_history: bool = False) -> None:
         self.use_dm: bool = use_density_matrix
         self.state: np.ndarray = np.array([1, 0], dtype=complex)
         self.dm: Optional[np.ndarray] = (
             np.outer(self.state, self.state.conj()) if self.use_dm else None
         )
         self.history: list = []
+        self._track_history: bool = track_history
 
     def apply_single_qubit_gate(self, gate_matrix: np.ndarray) -> None:
         """Apply a single-qubit unitary gate."""
         if self.use_dm and self.dm is not None:
             self.dm = gate_matrix @ self.dm @ gate_matrix.conj().T
-            eigenvals, eigenvecs = np.linalg.eig(self.dm)
-            self.state = eigenvecs[:, np.argmax(np.abs(eigenvals))]
-        else:
-            self.state = gate_matrix @ self.state
-        self.history.append(("gate", gate_matrix))
+        self.state = gate_matrix @ self.state
+        if self._track_history:
+            self.history.append(("gate", gate_matrix))
 
     def measure(self, basis: str = "Z") -> int:
         """
@@ -44,33 +52,37 @@ class Tetron:
         Returns the outcome (0 or 1).
         """
         if basis.upper() == "Z":
-            probs = np.abs(self.state) ** 2
-            outcome = int(np.random.choice([0, 1], p=probs))
-            proj = np.array([1, 0], dtype=complex) if outcome == 0 else np.array([0, 1], dtype=complex)
+            if self.use_dm:
+                probs = np.real(np.diag(self.dm))
+            else:
+                probs = np.abs(self.state) ** 2
+            outcome = 1 if np.random.random() < float(probs[1]) else 0
+            proj = _KET1 if outcome else _KET0
         elif basis.upper() == "X":
-            state_x = np.array(
-                [(self.state[0] + self.state[1]) / np.sqrt(2),
-                 (self.state[0] - self.state[1]) / np.sqrt(2)],
-                dtype=complex
-            )
-            probs = np.abs(state_x) ** 2
-            outcome = int(np.random.choice([0, 1], p=probs))
-            proj = (np.array([1, 1], dtype=complex) / np.sqrt(2)
-                    if outcome == 0 else np.array([1, -1], dtype=complex) / np.sqrt(2))
+            # <-|ψ><ψ|-> = 1/2 - Re(a* b); for ρ it is 1/2 - Re(ρ01).
+            if self.use_dm:
+                p1 = 0.5 - self.dm[0, 1].real
+            else:
+                p1 = 0.5 - (self.state[0].conjugate() * self.state[1]).real
+            outcome = 1 if np.random.random() < p1 else 0
+            proj = _KETMINUS if outcome else _KETPLUS
         else:
             raise ValueError("Unsupported basis. Choose 'X' or 'Z'.")
-        self.state = proj
+        # Copy so that state stays writable, as it is after __init__.
+        self.state = proj.copy()
         if self.use_dm:
             self.dm = np.outer(self.state, self.state.conj())
-        self.history.append(("measure", basis, outcome))
+        if self._track_history:
+            self.history.append(("measure", basis, outcome))
         return outcome
 
     def reset(self) -> None:
         """Reset the tetron to |0>."""
-        self.state = np.array([1, 0], dtype=complex)
+        self.state = _KET0.copy()
         if self.use_dm:
             self.dm = np.outer(self.state, self.state.conj())
-        self.history.append(("reset",))
+        if self._track_history:
+            self.history.append(("reset",))
 
     def __str__(self) -> str:
         return f"Tetron(state={self.state}, use_dm={self.use_dm})"
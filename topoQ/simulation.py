@@ -2,17 +2,26 @@
 Simulation engine for topoQ circuits.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 import numpy as np
-from .circuit import Circuit
+from collections import Counter
+from functools import reduce
+from ._kernels import apply_1q, apply_2q, apply_dense
+from .circuit import Circuit, OpKind
 from .error_model import AssignmentError, DepolarizingNoise
-from tqdm import tqdm
+from .gates import _H
+from .qubit import _KET0, _KET1, _KETMINUS, _KETPLUS
+
+# (outcome 0, outcome 1) post-measurement kets per basis.
+_BASIS_KETS = {"Z": (_KET0, _KET1), "X": (_KETPLUS, _KETMINUS)}
 
 
 class Simulation:
     """
     Simulation engine to run a circuit over multiple shots.
-    Supports a "statevector" backend (default) and stubs for density matrix simulation.
+    Supports a "statevector" backend (default), a "cuda" backend that samples
+    product-state circuits with CuPy when available, and stubs for density
+    matrix simulation.
     """
 
     def __init__(
@@ -27,23 +36,197 @@ class Simulation:
         self.assign_error_model: Any = assign_error_model
         self.backend: str = backend
 
-    def run(self, shots: int = 1024) -> Dict[Any, int]:
-        results: List[dict] = []
-        for _ in tqdm(range(shots), desc="Running simulation shots"):
-            self.circuit.clear_operations()
-            shot_result = self.circuit.run()
-            if self.assign_error_model is not None:
-                for qubit in shot_result:
-                    shot_result[qubit] = self.assign_error_model.apply(shot_result[qubit])
-            results.append(shot_result)
-        return self.aggregate_results(results)
+    def _compile_plan(self) -> List[tuple]:
+        """
+        Translate the circuit into an execution plan with every gate matrix
+        materialized once (pre-transposed for row-vector states). The plan is
+        rebuilt on every run, so edits to the circuit are always picked up.
+        """
+        return [
+            (OpKind.GATE, op[1], op[2].matrix().T) if op[0] == OpKind.GATE else op
+            for op in self.circuit.operations
+        ]
+
+    def run(self, shots: int = 1024, return_array: bool = False) -> Union[Dict[Any, int], np.ndarray]:
+        """
+        Run the circuit for the given number of shots.
+        Measurement outcomes for all shots are sampled in a single vectorized
+        draw. Circuits without multi-qubit gates are evolved qubit by qubit;
+        circuits with them use the full statevector kernels in _kernels.
+
+        Returns a histogram keyed by per-qubit outcome tuples (None for
+        unmeasured qubits), or, with return_array=True, the raw
+        (shots, num_qubits) int8 outcome array with -1 for unmeasured qubits.
+        """
+        plan = self._compile_plan()
+        xp = _array_module(self.backend)
+        entangling = any(op[0] == OpKind.MULTI_GATE for op in plan)
+        if (self.backend in ("statevector", "cuda") and len(self.circuit.qubits) > 1
+                and entangling):
+            outcomes = xp.asarray(self._run_statevector(plan, shots))
+        else:
+            outcomes = self._run_product(plan, shots, xp)
+        if self.assign_error_model is not None:
+            flips = xp.random.random(outcomes.shape) < self.assign_error_model.p_a
+            outcomes ^= (flips & (outcomes >= 0)).astype(xp.int8)
+        if return_array:
+            return outcomes.get() if xp is not np else outcomes
+        rows, counts = xp.unique(outcomes, axis=0, return_counts=True)
+        return {
+            tuple(None if bit < 0 else bit for bit in row): count
+            for row, count in zip(rows.tolist(), counts.tolist())
+        }
+
+    def _run_product(self, plan: List[tuple], shots: int, xp: Any = np) -> Any:
+        """
+        Evolve each qubit independently. After a measurement the qubit
+        carries one collapsed state per shot, shape (shots, 2).
+        Multi-qubit gates are not simulated on this path.
+        xp is the array module (NumPy, or CuPy for the "cuda" backend).
+        """
+        num_qubits = len(self.circuit.qubits)
+        states = [xp.asarray(qubit.state) for qubit in self.circuit.qubits]
+        outcomes = xp.full((shots, num_qubits), -1, dtype=xp.int8)
+        ket_zero = xp.asarray(_BASIS_KETS["Z"][0])
+        for op in plan:
+            if op[0] == OpKind.GATE:
+                states[op[1]] = states[op[1]] @ xp.asarray(op[2])
+            elif op[0] == OpKind.MEASURE:
+                basis = _check_basis(op[2])
+                state = states[op[1]]
+                if basis == "X":
+                    state = state @ xp.asarray(_H)
+                p1 = xp.abs(state[..., 1]) ** 2
+                bits = xp.random.random(shots) < p1
+                ket0, ket1 = (xp.asarray(ket) for ket in _BASIS_KETS[basis])
+                states[op[1]] = xp.where(bits[:, None], ket1, ket0)
+                outcomes[:, op[1]] = bits
+            elif op[0] == OpKind.RESET:
+                states[op[1]] = ket_zero
+            elif op[0] == OpKind.RESET_ALL:
+                states = [ket_zero] * num_qubits
+        return outcomes
+
+    def _run_statevector(self, plan: List[tuple], shots: int) -> np.ndarray:
+        """
+        Evolve the joint 2^n statevector. A single state is kept until a
+        measurement or reset needs per-shot collapse, at which point it is
+        expanded to a (shots, 2^n) batch. Trailing measurements on distinct
+        qubits are sampled jointly from the final state without expansion.
+        """
+        num_qubits = len(self.circuit.qubits)
+        psi = reduce(np.kron, [qubit.state for qubit in self.circuit.qubits])
+        states = np.array(psi, dtype=np.complex128).reshape(1, -1)
+        outcomes = np.full((shots, num_qubits), -1, dtype=np.int8)
+        for pos, op in enumerate(plan):
+            if op[0] == OpKind.GATE:
+                apply_1q(states, op[2].T, op[1], num_qubits)
+            elif op[0] == OpKind.MULTI_GATE:
+                if len(op[1]) == 2:
+                    apply_2q(states, op[2].matrix(), op[1][0], op[1][1], num_qubits)
+                else:
+                    apply_dense(states, op[2].matrix(), op[1], num_qubits)
+            elif op[0] == OpKind.MEASURE:
+                if states.shape[0] == 1 and _trailing_measurements(plan, pos):
+                    _sample_trailing(states, plan[pos:], outcomes, num_qubits)
+                    break
+                if states.shape[0] == 1:
+                    states = np.repeat(states, shots, axis=0)
+                outcomes[:, op[1]] = _collapse(states, op[1], num_qubits, _check_basis(op[2]))
+            elif op[0] == OpKind.RESET:
+                view = _qubit_view(states, op[1], num_qubits)
+                if states.shape[0] == 1 and not np.any(view[:, :, 1, :]):
+                    continue
+                if states.shape[0] == 1:
+                    states = np.repeat(states, shots, axis=0)
+                    view = _qubit_view(states, op[1], num_qubits)
+                bits = _collapse(states, op[1], num_qubits, "Z")
+                view[bits, :, 0, :] = view[bits, :, 1, :]
+                view[bits, :, 1, :] = 0
+            elif op[0] == OpKind.RESET_ALL:
+                # Every shot lands in |0...0>, so the batch collapses back
+                # to a single state.
+                states = np.zeros((1, states.shape[1]), dtype=np.complex128)
+                states[0, 0] = 1
+        return outcomes
 
     def aggregate_results(self, results: List[dict]) -> Dict[Any, int]:
-        histogram: Dict[Any, int] = {}
-        for shot in results:
-            key = tuple(shot.get(i, None) for i in range(len(self.circuit.qubits)))
-            histogram[key] = histogram.get(key, 0) + 1
-        return histogram
+        """
+        Build a histogram from per-shot result dicts (as returned by
+        Circuit.run). run() no longer needs this; it is kept for callers
+        that collect shots themselves.
+        """
+        n = len(self.circuit.qubits)
+        return dict(Counter(tuple(shot.get(i) for i in range(n)) for shot in results))
+
+
+def _array_module(backend: str) -> Any:
+    """
+    Return CuPy for the "cuda" backend when it is installed, NumPy otherwise.
+    Only product-state shot sampling and histogramming run on the GPU;
+    circuits with multi-qubit gates are evolved and sampled on the CPU.
+    """
+    if backend == "cuda":
+        try:
+            import cupy
+            return cupy
+        except ImportError:
+            pass
+    return np
+
+
+def _check_basis(basis: str) -> str:
+    basis = basis.upper()
+    if basis not in _BASIS_KETS:
+        raise ValueError("Unsupported basis. Choose 'X' or 'Z'.")
+    return basis
+
+
+def _qubit_view(states: np.ndarray, qubit: int, num_qubits: int) -> np.ndarray:
+    """View a (batch, 2^n) array as (batch, high, 2, low) around one qubit's bit."""
+    return states.reshape(states.shape[0], -1, 2, 1 << (num_qubits - 1 - qubit))
+
+
+def _collapse(states: np.ndarray, qubit: int, num_qubits: int, basis: str) -> np.ndarray:
+    """Projectively measure `qubit` in every state of the batch, in place."""
+    if basis == "X":
+        apply_1q(states, _H, qubit, num_qubits)
+    view = _qubit_view(states, qubit, num_qubits)
+    weights = np.abs(view) ** 2
+    p0 = weights[:, :, 0, :].sum(axis=(1, 2))
+    p1 = weights[:, :, 1, :].sum(axis=(1, 2))
+    bits = np.random.random(states.shape[0]) * (p0 + p1) < p1
+    view[bits, :, 0, :] = 0
+    view[~bits, :, 1, :] = 0
+    states /= np.sqrt(np.where(bits, p1, p0))[:, None]
+    if basis == "X":
+        apply_1q(states, _H, qubit, num_qubits)
+    return bits
+
+
+def _trailing_measurements(plan: List[tuple], pos: int) -> bool:
+    """True if plan[pos:] only measures qubits, each at most once."""
+    seen = set()
+    for op in plan[pos:]:
+        if op[0] != OpKind.MEASURE or op[1] in seen:
+            return False
+        seen.add(op[1])
+    return True
+
+
+def _sample_trailing(
+    states: np.ndarray, measures: List[tuple], outcomes: np.ndarray, num_qubits: int
+) -> None:
+    """Sample commuting final measurements jointly by inverse-CDF on |psi|^2."""
+    for op in measures:
+        if _check_basis(op[2]) == "X":
+            apply_1q(states, _H, op[1], num_qubits)
+    cdf = np.cumsum(np.abs(states[0]) ** 2)
+    shots = outcomes.shape[0]
+    idx = np.searchsorted(cdf, np.random.random(shots) * cdf[-1], side="right")
+    idx = np.minimum(idx, cdf.size - 1)
+    for op in measures:
+        outcomes[:, op[1]] = (idx >> (num_qubits - 1 - op[1])) & 1
 
 
 def run_density_matrix_simulation(circuit: Circuit, shots: int = 1024) -> Dict[Any, int]:
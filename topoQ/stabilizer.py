@@ -3,13 +3,18 @@ Defines stabilizer operators and stabilizer codes.
 """
 
 import numpy as np
-from typing import List
+from typing import List, Optional, Tuple
 from .utils import kron, pauli_operator
 
 
 class Stabilizer:
     """
     Represents a stabilizer operator defined on selected qubits.
+
+    A Pauli string is a monomial matrix: it maps |b> to i^nY (-1)^|b & z| |b ^ x>,
+    where x marks the X/Y positions and z the Z/Y positions. Expectation values
+    are computed from that action on a length-2^n index table, so the dense
+    2^n x 2^n operator is only built if `operator` is accessed.
     """
 
     def __init__(self, qubit_indices: List[int], paulis: List[str]) -> None:
@@ -17,7 +22,15 @@ class Stabilizer:
             raise ValueError("qubit_indices and paulis must have equal length.")
         self.qubit_indices: List[int] = qubit_indices
         self.paulis: List[str] = paulis
-        self.operator: np.ndarray = self.build_operator()
+        self._operator: Optional[np.ndarray] = None
+        self._source, self._phases = self._monomial_action()
+
+    @property
+    def operator(self) -> np.ndarray:
+        """Dense matrix form of the stabilizer, built on first access."""
+        if self._operator is None:
+            self._operator = self.build_operator()
+        return self._operator
 
     def build_operator(self) -> np.ndarray:
         total_qubits: int = max(self.qubit_indices) + 1
@@ -30,11 +43,40 @@ class Stabilizer:
                 op_list.append(np.eye(2, dtype=complex))
         return kron(op_list)
 
+    def _monomial_action(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return (source, phases) such that (S @ state)[k] == phases[k] * state[source[k]].
+        Qubit 0 is the most significant bit, matching the kron ordering.
+        """
+        total_qubits: int = max(self.qubit_indices) + 1
+        x_mask = z_mask = num_y = 0
+        for i in range(total_qubits):
+            if i not in self.qubit_indices:
+                continue
+            pauli = self.paulis[self.qubit_indices.index(i)].upper()
+            pauli_operator(pauli)  # Validate the label.
+            bit = 1 << (total_qubits - 1 - i)
+            if pauli in ("X", "Y"):
+                x_mask |= bit
+            if pauli in ("Z", "Y"):
+                z_mask |= bit
+            if pauli == "Y":
+                num_y += 1
+        source = np.arange(1 << total_qubits) ^ x_mask
+        parity = np.zeros(source.shape, dtype=np.int64)
+        masked = source & z_mask
+        while z_mask:
+            parity ^= masked & 1
+            masked >>= 1
+            z_mask >>= 1
+        phases = (1j ** num_y) * (1 - 2 * parity)
+        return source, phases
+
     def measure(self, state: np.ndarray) -> complex:
         """
         Compute the expectation value ⟨state|S|state⟩.
         """
-        return np.vdot(state, self.operator @ state)
+        return np.vdot(state, self._phases * state[self._source])
 
     def __str__(self) -> str:
         return f"Stabilizer(qubits={self.qubit_indices}, paulis={self.paulis})"
@@ -4,55 +4,78 @@ Transpiler module: Converts Circuit objects to JSON and OpenQASM.
 
 import json
 from datetime import datetime
-from typing import Any
-from .circuit import Circuit
+from typing import Any, Optional
+from .circuit import Circuit, OpKind, OP_NAMES
 
 
-def circuit_to_json(circuit: Circuit) -> str:
+def _gate_to_dict(op: tuple, ts: str) -> dict:
+    gate = op[2]
+    op_dict = {
+        "type": OP_NAMES[OpKind.GATE],
+        "qubit": op[1],
+        "name": str(gate).split("(")[0],
+        "timestamp": ts
+    }
+    if hasattr(gate, "theta"):
+        op_dict["theta"] = gate.theta
+    if hasattr(gate, "generator_name"):
+        op_dict["generator"] = gate.generator_name
+    return op_dict
+
+
+def _multi_gate_to_dict(op: tuple, ts: str) -> dict:
+    return {
+        "type": OP_NAMES[OpKind.MULTI_GATE],
+        "qubits": op[1],
+        "name": str(op[2]).split("(")[0],
+        "timestamp": ts
+    }
+
+
+def _measure_to_dict(op: tuple, ts: str) -> dict:
+    return {
+        "type": OP_NAMES[OpKind.MEASURE],
+        "qubit": op[1],
+        "basis": op[2],
+        "timestamp": ts
+    }
+
+
+def _reset_to_dict(op: tuple, ts: str) -> dict:
+    return {
+        "type": OP_NAMES[OpKind.RESET],
+        "qubit": op[1],
+        "timestamp": ts
+    }
+
+
+def _reset_all_to_dict(op: tuple, ts: str) -> dict:
+    return {
+        "type": OP_NAMES[OpKind.RESET_ALL],
+        "timestamp": ts
+    }
+
+
+# Indexed by OpKind.
+_JSON_HANDLERS = (
+    _gate_to_dict, _multi_gate_to_dict, _measure_to_dict, _reset_to_dict, _reset_all_to_dict
+)
+
+
+def circuit_to_json(circuit: Circuit, indent: Optional[int] = 2) -> str:
     """
     Converts a Circuit object to a JSON string with metadata.
+    All operations share the export timestamp. Pass indent=None for compact,
+    machine-readable output.
     """
-    ops_list = []
-    for op in circuit.operations:
-        if op[0] == "gate":
-            gate = op[2]
-            op_dict = {
-                "type": "gate",
-                "qubit": op[1],
-                "name": str(gate).split("(")[0],
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            if hasattr(gate, "theta"):
-                op_dict["theta"] = gate.theta
-            if hasattr(gate, "generator_name"):
-                op_dict["generator"] = gate.generator_name
-            ops_list.append(op_dict)
-        elif op[0] == "measure":
-            ops_list.append({
-                "type": "measure",
-                "qubit": op[1],
-                "basis": op[2],
-                "timestamp": datetime.utcnow().isoformat()
-            })
-        elif op[0] == "reset":
-            ops_list.append({
-                "type": "reset",
-                "qubit": op[1],
-                "timestamp": datetime.utcnow().isoformat()
-            })
-        elif op[0] == "multi_gate":
-            ops_list.append({
-                "type": "multi_gate",
-                "qubits": op[1],
-                "name": str(op[2]).split("(")[0],
-                "timestamp": datetime.utcnow().isoformat()
-            })
+    ts = datetime.utcnow().isoformat()
+    ops_list = [_JSON_HANDLERS[op[0]](op, ts) for op in circuit.operations]
     circuit_dict: dict = {
         "num_qubits": len(circuit.qubits),
         "operations": ops_list,
-        "generated_at": datetime.utcnow().isoformat()
+        "generated_at": ts
     }
-    return json.dumps(circuit_dict, indent=2)
+    return json.dumps(circuit_dict, indent=indent)
 
 
 def circuit_from_json(json_str: str) -> Circuit:
@@ -88,11 +111,23 @@ def circuit_from_json(json_str: str) -> Circuit:
             circ.measure(op["qubit"], basis=op["basis"])
         elif op["type"] == "reset":
             circ.reset(op["qubit"])
+        elif op["type"] == "reset_all":
+            circ.reset()
         elif op["type"] == "multi_gate":
             pass  # Stub: skip multi-qubit gate reconstruction.
     return circ
 
 
+# Indexed by OpKind; None means the operation has no OpenQASM form yet.
+_QASM_HANDLERS = (
+    lambda op: f"// {str(op[2])} on q[{op[1]}]",
+    lambda op: None,
+    lambda op: f"measure q[{op[1]}] -> c[{op[1]}];",
+    lambda op: f"reset q[{op[1]}];",
+    lambda op: "reset q;",
+)
+
+
 def circuit_to_openqasm(circuit: Circuit) -> str:
     """
     Stub: Converts a Circuit object to an OpenQASM-like string.
@@ -101,10 +136,7 @@ def circuit_to_openqasm(circuit: Circuit) -> str:
     num_qubits: int = len(circuit.qubits)
     qasm_lines.append(f"qubit[{num_qubits}] q;")
     for op in circuit.operations:
-        if op[0] == "gate":
-            qasm_lines.append(f"// {str(op[2])} on q[{op[1]}]")
-        elif op[0] == "measure":
-            qasm_lines.append(f"measure q[{op[1]}] -> c[{op[1]}];")
-        elif op[0] == "reset":
-            qasm_lines.append(f"reset q[{op[1]}];")
+        line = _QASM_HANDLERS[op[0]](op)
+        if line is not None:
+            qasm_lines.append(line)
     return "\n".join(qasm_lines)
@@ -7,21 +7,28 @@ from functools import reduce
 from typing import List
 
 
+_PAULI = {
+    name: np.array(matrix, dtype=complex)
+    for name, matrix in (
+        ("I", [[1, 0], [0, 1]]),
+        ("X", [[0, 1], [1, 0]]),
+        ("Y", [[0, -1j], [1j, 0]]),
+        ("Z", [[1, 0], [0, -1]]),
+    )
+}
+for _matrix in _PAULI.values():
+    _matrix.setflags(write=False)
+
+
 def pauli_operator(op: str) -> np.ndarray:
     """
     Returns the 2x2 numpy array corresponding to the given Pauli operator.
+    The array is a shared read-only constant; call .copy() before mutating it.
     """
-    op = op.upper()
-    if op == "I":
-        return np.array([[1, 0], [0, 1]], dtype=complex)
-    elif op == "X":
-        return np.array([[0, 1], [1, 0]], dtype=complex)
-    elif op == "Y":
-        return np.array([[0, -1j], [1j, 0]], dtype=complex)
-    elif op == "Z":
-        return np.array([[1, 0], [0, -1]], dtype=complex)
-    else:
-        raise ValueError("Unsupported Pauli operator. Choose from I, X, Y, Z.")
+    try:
+        return _PAULI[op.upper()]
+    except KeyError:
+        raise ValueError("Unsupported Pauli operator. Choose from I, X, Y, Z.") from None
 
 
 def kron(ops: List[np.ndarray]) -> np.ndarray:
@@ -3,9 +3,15 @@ Variational algorithm routines for topoQ.
 Includes variational optimization and stubs for VQE and QAOA.
 """
 
+import sys
 import numpy as np
-from typing import Callable, List, Tuple
-from tqdm import tqdm
+from contextlib import nullcontext
+from functools import partial
+from typing import Any, Callable, ContextManager, List, Optional, Tuple, Union
+from ._jit import jit_loop
+
+# Generator for the placeholder costs; .random() returns a plain float.
+_rng = np.random.default_rng()
 
 
 def variational_optimization(
@@ -14,43 +20,294 @@ def variational_optimization(
     parameters: List[float],
     learning_rate: float = 0.1,
     max_iter: int = 100,
+    parameter_indices: Optional[List[int]] = None,
+    gradient_method: str = "parameter_shift",
+    n_jobs: int = 1,
+    bind_fn: Optional[Callable[[Any, List[float]], Any]] = None,
+    batch_cost_function: Optional[Callable[[List[Any]], np.ndarray]] = None,
+    delta: float = 1e-2,
+    optimizer: str = "sgd",
+    metric_tensor_fn: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    progress: bool = True,
+    params_as_array: bool = False,
+    tol: float = 1e-6,
+    return_cost: bool = True,
+    copy: bool = True,
+) -> Union[Tuple[np.ndarray, float], np.ndarray]:
+    """
+    Variational optimization by gradient descent. Returns (params, final_cost).
+      circuit_template: params -> Circuit; must not keep the params it is passed.
+      cost_function: Circuit -> scalar cost.
+      parameters: initial parameter values.
+      learning_rate, max_iter: step size and iteration limit.
+      parameter_indices: operation index of the BraidingGate each parameter sets;
+        the circuit is then built once per iteration and its thetas rebound.
+      gradient_method: "parameter_shift" (shift π/4) or "finite_diff" (central
+        differences with step delta). Parameter shift is exact only if each
+        parameter is the angle θ of exactly one exp(-iθG) gate with G² = I.
+        Both use 2n evaluations at θ ± shift per iteration; no unshifted
+        baseline cost is evaluated.
+      n_jobs: joblib workers for the shifted evaluations (1 runs serially).
+      bind_fn: bind_fn(template, params) -> Circuit; rebinds a template built once.
+      batch_cost_function: scores the 2n shifted circuits of a gradient in one call.
+      delta: finite-difference step.
+      optimizer: "sgd" or "adam".
+      metric_tensor_fn: params -> metric used to precondition the gradient.
+      progress: show a tqdm bar when stderr is a terminal.
+      params_as_array: pass float64 ndarrays instead of lists to the template.
+      tol: stop once the gradient or update norm falls below tol.
+      return_cost: if False, return params only and skip the final evaluation.
+      copy: if False, a float64 ndarray passed as parameters is updated in place.
+    """
+    shift, scale = _shift_and_scale(gradient_method, delta)
+    if optimizer not in ("sgd", "adam"):
+        raise ValueError("Unsupported optimizer. Use 'sgd' or 'adam'.")
+    params_array = _as_params_array(parameters, copy)
+    to_input = _identity if params_as_array else np.ndarray.tolist
+    if optimizer == "adam":
+        beta1, beta2, eps = 0.9, 0.999, 1e-8
+        m = np.zeros_like(params_array)
+        v = np.zeros_like(params_array)
+    if bind_fn is not None:
+        template = circuit_template(to_input(params_array))
+        build_circuit = partial(bind_fn, template)
+    else:
+        build_circuit = circuit_template
+    if parameter_indices is not None and len(parameter_indices) != len(params_array):
+        raise ValueError("parameter_indices must name one operation per parameter.")
+    if parameter_indices is not None and (batch_cost_function is not None or n_jobs != 1):
+        raise ValueError("parameter_indices cannot be combined with batch_cost_function or n_jobs.")
+    if batch_cost_function is not None and n_jobs != 1:
+        raise ValueError("batch_cost_function cannot be combined with n_jobs.")
+    # Every path below overwrites all entries, so no zero-fill is needed.
+    grad = np.empty_like(params_array)
+    steps = range(1, max_iter + 1)
+    if progress and sys.stderr.isatty():
+        from tqdm import tqdm
+        steps = tqdm(steps, desc="Optimizing parameters", mininterval=1.0)
+    for step in steps:
+        if parameter_indices is not None:
+            circuit = build_circuit(to_input(params_array))
+            for j, op_index in enumerate(parameter_indices):
+                gate = circuit.operations[op_index][2]
+                theta = gate.theta
+                gate.theta = theta + shift
+                cost_plus = cost_function(circuit)
+                gate.theta = theta - shift
+                cost_minus = cost_function(circuit)
+                gate.theta = theta
+                grad[j] = cost_plus - cost_minus
+        elif batch_cost_function is not None:
+            shifted = to_input(_shifted_rows(params_array, shift))
+            costs = np.asarray(batch_cost_function([build_circuit(p) for p in shifted]))
+            grad[:] = costs[0::2] - costs[1::2]
+        elif n_jobs != 1:
+            shifted = to_input(_shifted_rows(params_array, shift))
+            costs = _evaluate_costs(build_circuit, cost_function, shifted, n_jobs)
+            grad[:] = costs[0::2] - costs[1::2]
+        else:
+            scratch = params_array.copy() if params_as_array else params_array.tolist()
+            for j, value in enumerate(scratch):
+                scratch[j] = value + shift
+                cost_plus = cost_function(build_circuit(scratch))
+                scratch[j] = value - shift
+                cost_minus = cost_function(build_circuit(scratch))
+                scratch[j] = value
+                grad[j] = cost_plus - cost_minus
+        grad *= scale
+        if np.linalg.norm(grad) < tol:
+            break
+        direction = grad
+        if metric_tensor_fn is not None:
+            direction = np.linalg.lstsq(metric_tensor_fn(params_array), grad, rcond=None)[0]
+        if optimizer == "adam":
+            m = beta1 * m + (1 - beta1) * direction
+            v = beta2 * v + (1 - beta2) * direction ** 2
+            m_hat = m / (1 - beta1 ** step)
+            v_hat = v / (1 - beta2 ** step)
+            update = learning_rate * m_hat / (np.sqrt(v_hat) + eps)
+        else:
+            update = learning_rate * direction
+        params_array -= update
+        if np.linalg.norm(update) < tol:
+            break
+    if not return_cost:
+        return params_array
+    return params_array, float(cost_function(build_circuit(to_input(params_array))))
+
+
+def variational_optimization_multistart(
+    circuit_template: Callable[[List[float]], Any],
+    cost_function: Callable[[Any], float],
+    initial_params_list: List[List[float]],
+    n_jobs: int = 1,
+    **kwargs,
+) -> Tuple[np.ndarray, float]:
+    """
+    Run variational_optimization (with kwargs) from each starting point, in
+    n_jobs joblib workers with BLAS pinned to one thread, and return the
+    (params, final_cost) pair with the lowest cost.
+    """
+    if len(initial_params_list) == 0:
+        raise ValueError("initial_params_list must contain at least one starting point.")
+    kwargs = dict(kwargs, progress=False, return_cost=True)
+    run = partial(_optimize_pinned, circuit_template, cost_function, kwargs)
+    try:
+        from joblib import Parallel, delayed
+    except ImportError:
+        n_jobs = 1
+    if n_jobs == 1:
+        results = [run(p0) for p0 in initial_params_list]
+    else:
+        results = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(run)(p0) for p0 in initial_params_list
+        )
+    return min(results, key=lambda result: result[1])
+
+
+def variational_optimization_jit(
+    cost_numba: Callable[[np.ndarray], float],
+    parameters: List[float],
+    learning_rate: float = 0.1,
+    max_iter: int = 100,
+    gradient_method: str = "finite_diff",
+    delta: float = 1e-2,
+    tol: float = 1e-6,
+    return_cost: bool = True,
+    copy: bool = True,
+) -> Union[Tuple[np.ndarray, float], np.ndarray]:
+    """
+    Gradient descent for a numeric @njit cost_numba(params) -> float, with the
+    gradient loop compiled by Numba when it is installed. The other arguments
+    are as in variational_optimization.
+    """
+    shift, scale = _shift_and_scale(gradient_method, delta)
+    params_array = _as_params_array(parameters, copy)
+    grad = np.empty_like(params_array)
+    shift_gradient = jit_loop(_make_shift_gradient) or _make_shift_gradient(range)
+    for _ in range(max_iter):
+        shift_gradient(cost_numba, params_array, shift, scale, grad)
+        if np.linalg.norm(grad) < tol:
+            break
+        update = learning_rate * grad
+        params_array -= update
+        if np.linalg.norm(update) < tol:
+            break
+    if not return_cost:
+        return params_array
+    return params_array, float(cost_numba(params_array))
+
+
+def _shift_and_scale(gradient_method: str, delta: float) -> Tuple[float, float]:
+    """Shift and prefactor of the two-point gradient rule named by gradient_method."""
+    if gradient_method == "parameter_shift":
+        return np.pi / 4, 1.0
+    if gradient_method == "finite_diff":
+        return delta, 1.0 / (2 * delta)
+    raise ValueError("Unsupported gradient method. Use 'parameter_shift' or 'finite_diff'.")
+
+
+def _make_shift_gradient(prange: Callable) -> Callable:
+    def shift_gradient(cost, params, shift, scale, grad):
+        """grad[j] = scale * (cost(params + shift e_j) - cost(params - shift e_j))."""
+        for j in prange(params.shape[0]):
+            shifted = params.copy()
+            shifted[j] = params[j] + shift
+            cost_plus = cost(shifted)
+            shifted[j] = params[j] - shift
+            cost_minus = cost(shifted)
+            grad[j] = scale * (cost_plus - cost_minus)
+    return shift_gradient
+
+
+def _as_params_array(parameters: List[float], copy: bool) -> np.ndarray:
+    """Float64 working array for the optimizers; shares memory with parameters only if copy is False."""
+    if copy:
+        return np.array(parameters, dtype=np.float64)
+    return np.asarray(parameters, dtype=np.float64)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _shifted_rows(params_array: np.ndarray, shift: float) -> np.ndarray:
+    """
+    Return a (2n, n) array whose row 2j is params + shift * e_j and whose
+    row 2j + 1 is params - shift * e_j.
+    """
+    n = len(params_array)
+    shifted = np.repeat(params_array[None, :], 2 * n, axis=0)
+    shifted[2 * np.arange(n), np.arange(n)] += shift
+    shifted[2 * np.arange(n) + 1, np.arange(n)] -= shift
+    return shifted
+
+
+def _evaluate_costs(
+    circuit_template: Callable[[List[float]], Any],
+    cost_function: Callable[[Any], float],
+    param_vectors: List[Any],
+    n_jobs: int,
 ) -> np.ndarray:
     """
-    Variational optimization using finite-difference gradients.
-    circuit_template(params) returns a Circuit.
-    cost_function(circuit) returns a scalar cost.
+    Evaluate cost_function(circuit_template(p)) for each entry of param_vectors,
+    across joblib workers when available and serially otherwise.
     """
-    params_array = np.array(parameters, dtype=float)
-    delta = 1e-4
-    for _ in tqdm(range(max_iter), desc="Optimizing parameters"):
-        circuit = circuit_template(params_array.tolist())
-        cost = cost_function(circuit)
-        grad = np.zeros_like(params_array)
-        for j in range(len(params_array)):
-            params_delta = np.copy(params_array)
-            params_delta[j] += delta
-            circuit_delta = circuit_template(params_delta.tolist())
-            cost_delta = cost_function(circuit_delta)
-            grad[j] = (cost_delta - cost) / delta
-        params_array -= learning_rate * grad
-    return params_array
+    try:
+        from joblib import Parallel, delayed
+    except ImportError:
+        return np.array([_evaluate_pinned(circuit_template, cost_function, p) for p in param_vectors])
+    return np.array(Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_evaluate_pinned)(circuit_template, cost_function, p) for p in param_vectors
+    ))
+
+
+def _evaluate_pinned(
+    circuit_template: Callable[[List[float]], Any],
+    cost_function: Callable[[Any], float],
+    params: Any,
+) -> float:
+    """Evaluate one parameter vector with BLAS limited to a single thread."""
+    with _single_blas_thread():
+        return cost_function(circuit_template(params))
+
+
+def _optimize_pinned(
+    circuit_template: Callable[[List[float]], Any],
+    cost_function: Callable[[Any], float],
+    kwargs: dict,
+    parameters: List[float],
+) -> Tuple[np.ndarray, float]:
+    """Run one variational_optimization with BLAS limited to a single thread."""
+    with _single_blas_thread():
+        return variational_optimization(circuit_template, cost_function, parameters, **kwargs)
+
+
+def _single_blas_thread() -> ContextManager:
+    """threadpoolctl's threadpool_limits(1) if installed, otherwise a no-op context."""
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return nullcontext()
+    return threadpool_limits(1)
 
 
 def vqe_stub(
     hamiltonian: Any,
     circuit_template: Callable[[List[float]], Any],
     parameters: List[float],
-    optimizer_fn: Callable[..., np.ndarray] = variational_optimization,
+    optimizer_fn: Callable[..., Any] = variational_optimization,
     **kwargs,
 ) -> Tuple[np.ndarray, float]:
     """
     Stub for VQE. Returns optimized parameters and a dummy energy estimate.
+    optimizer_fn must accept return_cost as variational_optimization does.
     """
     def cost_fn(circuit: Any) -> float:
-        return np.random.rand()  # Placeholder
+        return _rng.random()  # Placeholder
 
-    opt_params = optimizer_fn(circuit_template, cost_fn, parameters, **kwargs)
-    energy_estimate = cost_fn(circuit_template(opt_params.tolist()))
+    opt_params, energy_estimate = optimizer_fn(circuit_template, cost_fn, parameters,
+                                               **dict(kwargs, return_cost=True))
     return opt_params, energy_estimate
 
 
@@ -58,15 +315,18 @@ def qaoa_stub(
     problem_instance: Any,
     circuit_template: Callable[[List[float]], Any],
     parameters: List[float],
-    optimizer_fn: Callable[..., np.ndarray] = variational_optimization,
+    optimizer_fn: Callable[..., Any] = variational_optimization,
     **kwargs,
 ) -> Tuple[np.ndarray, str]:
     """
     Stub for QAOA. Returns optimized parameters and a dummy solution bitstring.
+    optimizer_fn must accept return_cost as variational_optimization does.
     """
     def cost_fn(circuit: Any) -> float:
-        return np.random.rand()  # Placeholder
+        return _rng.random()  # Placeholder
 
-    opt_params = optimizer_fn(circuit_template, cost_fn, parameters, **kwargs)
+    # The final cost is not used, so skip the evaluation that produces it.
+    opt_params = optimizer_fn(circuit_template, cost_fn, parameters,
+                              **dict(kwargs, return_cost=False))
     solution = "1010"  # Placeholder solution
     return opt_params, solution
@@ -1,21 +1,42 @@
 """
 Visualization tools for topoQ.
+Matplotlib is imported inside the drawing functions so that importing topoQ
+does not pay its start-up cost.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from typing import Optional
+import sys
+import numpy as np
+from functools import lru_cache
+from typing import Optional, TextIO, Tuple
+from .circuit import OpKind
 from .transpiler import circuit_to_json
 
+_GATE_BBOX = dict(boxstyle="round,pad=0.3", fc="skyblue", ec="black", lw=1)
+_MEAS_BBOX = dict(boxstyle="round,pad=0.3", fc="lightgreen", ec="black", lw=1)
+_RESET_BBOX = dict(boxstyle="round,pad=0.3", fc="lightcoral", ec="black", lw=1)
+_MULTI_BBOX = dict(boxstyle="round,pad=0.3", fc="plum", ec="black", lw=1)
 
-def draw_circuit(circuit: object, save_path: Optional[str] = None) -> None:
+
+def draw_circuit(circuit: object, save_path: Optional[str] = None, show: bool = True) -> None:
     """
     Draws a static circuit diagram with pleasing colors.
+    With show=False the figure is only written to save_path: it is built
+    outside pyplot and rendered by the Agg canvas, so no GUI backend is
+    touched and nothing is left open afterwards.
     """
+    import matplotlib.patches as mpatches
+
     num_qubits: int = len(circuit.qubits)
     num_ops: int = len(circuit.operations)
 
-    fig, ax = plt.subplots(figsize=(max(8, num_ops * 0.8), num_qubits * 1))
+    figsize = (max(8, num_ops * 0.8), num_qubits * 1)
+    if show:
+        import matplotlib.pyplot as plt
+        fig, ax = plt.subplots(figsize=figsize)
+    else:
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=figsize)
+        ax = fig.add_subplot()
     ax.set_xlim(0, num_ops + 1)
     ax.set_ylim(-0.5, num_qubits - 0.5)
     ax.set_yticks(range(num_qubits))
@@ -23,30 +44,25 @@ def draw_circuit(circuit: object, save_path: Optional[str] = None) -> None:
     ax.set_xlabel("Circuit Depth")
     ax.set_title("topoQ Circuit Diagram")
 
-    for i in range(num_qubits):
-        ax.hlines(i, 0, num_ops + 1, color="gray", linestyle="--", linewidth=1)
+    ax.hlines(np.arange(num_qubits), 0, num_ops + 1, colors="gray",
+              linestyles="--", linewidths=1)
 
     for op_index, op in enumerate(circuit.operations, start=1):
         op_type = op[0]
-        if op_type == "gate":
-            gate = op[2]
-            gate_name = str(gate).split("(")[0]
-            ax.text(op_index, op[1], gate_name, ha="center", va="center",
-                    bbox=dict(boxstyle="round,pad=0.3", fc="skyblue",
-                              ec="black", lw=1))
-        elif op_type == "measure":
+        if op_type == OpKind.GATE:
+            ax.text(op_index, op[1], type(op[2]).__name__, ha="center", va="center",
+                    bbox=_GATE_BBOX)
+        elif op_type == OpKind.MEASURE:
             ax.text(op_index, op[1], f"M({op[2]})", ha="center", va="center",
-                    bbox=dict(boxstyle="round,pad=0.3", fc="lightgreen",
-                              ec="black", lw=1))
-        elif op_type == "reset":
-            ax.text(op_index, op[1], "RESET", ha="center", va="center",
-                    bbox=dict(boxstyle="round,pad=0.3", fc="lightcoral",
-                              ec="black", lw=1))
-        elif op_type == "multi_gate":
-            indices = op[1]
-            ax.text(op_index, min(indices), "MultiGate", ha="center", va="center",
-                    bbox=dict(boxstyle="round,pad=0.3", fc="plum",
-                              ec="black", lw=1))
+                    bbox=_MEAS_BBOX)
+        elif op_type == OpKind.RESET:
+            ax.text(op_index, op[1], "RESET", ha="center", va="center", bbox=_RESET_BBOX)
+        elif op_type == OpKind.RESET_ALL:
+            for i in range(num_qubits):
+                ax.text(op_index, i, "RESET", ha="center", va="center", bbox=_RESET_BBOX)
+        elif op_type == OpKind.MULTI_GATE:
+            ax.text(op_index, min(op[1]), "MultiGate", ha="center", va="center",
+                    bbox=_MULTI_BBOX)
 
     gate_patch = mpatches.Patch(color="skyblue", label="Gate")
     measure_patch = mpatches.Patch(color="lightgreen", label="Measure")
@@ -55,18 +71,31 @@ def draw_circuit(circuit: object, save_path: Optional[str] = None) -> None:
     ax.legend(handles=[gate_patch, measure_patch, reset_patch, multi_patch],
               loc="upper right")
 
-    plt.tight_layout()
+    fig.tight_layout()
     if save_path:
-        plt.savefig(save_path)
-    plt.show()
+        fig.savefig(save_path)
+    if show:
+        plt.show()
+
+
+@lru_cache(maxsize=1)
+def _bloch_mesh() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Unit-sphere surface grid for draw_bloch_sphere; state-independent, so built once."""
+    u, v = np.mgrid[0:2 * np.pi:50j, 0:np.pi:25j]
+    xs = np.cos(u) * np.sin(v)
+    ys = np.sin(u) * np.sin(v)
+    zs = np.cos(v)
+    for grid in (xs, ys, zs):
+        grid.setflags(write=False)
+    return xs, ys, zs
 
 
 def draw_bloch_sphere(qubit: object) -> None:
     """
     Draws a Bloch sphere representation for a single qubit state.
     """
-    from mpl_toolkits.mplot3d import Axes3D
-    import numpy as np
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.mplot3d import Axes3D  # Registers the 3d projection.
 
     fig = plt.figure(figsize=(6, 6))
     ax = fig.add_subplot(111, projection="3d")
@@ -78,10 +107,7 @@ def draw_bloch_sphere(qubit: object) -> None:
     y = np.sin(theta) * np.sin(phi)
     z = np.cos(theta)
 
-    u, v = np.mgrid[0:2 * np.pi:50j, 0:np.pi:25j]
-    xs = np.cos(u) * np.sin(v)
-    ys = np.sin(u) * np.sin(v)
-    zs = np.cos(v)
+    xs, ys, zs = _bloch_mesh()
     ax.plot_surface(xs, ys, zs, color="lightgray", alpha=0.3, edgecolor="none")
     ax.scatter([x], [y], [z], color="red", s=100)
     ax.set_title("Bloch Sphere")
@@ -91,10 +117,20 @@ def draw_bloch_sphere(qubit: object) -> None:
     plt.show()
 
 
-def interactive_circuit_view(circuit: object) -> None:
+def interactive_circuit_view(circuit: object, *, stream: Optional[TextIO] = None) -> Optional[str]:
     """
     Stub for an interactive circuit viewer.
     For full interactivity, integrate Plotly or Bokeh.
+
+    Writes the circuit's JSON to `stream` and returns it. With no stream,
+    stdout is used only when it is a terminal; otherwise nothing is
+    serialized and None is returned.
     """
-    print("Interactive circuit view (JSON):")
-    print(circuit_to_json(circuit))
+    if stream is None:
+        if not sys.stdout.isatty():
+            return None
+        stream = sys.stdout
+    json_str = circuit_to_json(circuit)
+    stream.write("Interactive circuit view (JSON):\n")
+    stream.write(json_str + "\n")
+    return json_str